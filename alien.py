@@ -25,18 +25,25 @@ import constants as cons
 if TYPE_CHECKING:
     from cosmic_standoff import CosmicStandoff
 
-# Aliases for the relevant Enums of constants.py.
-AlienMovesCond = cons.AlienMovesConditions
+# Aliases for the relevant constant classes of constants.py.
 AlienMoves = cons.AlienMoves
-BConfig = cons.BoardConfig
 Chars = cons.Characters
-Coords = cons.Coordinates
-Flags = cons.Flags
-Dist = cons.Distance
 Moves = cons.Moves
 NCons = cons.NumericalConstants
+Pos = cons.Positions
 Turns = cons.Turns
 
+# All the moves the Alien can make, built once for '_random()'.
+_ALL_MOVES = Moves.ALL
+
+# Constants read on every turn, bound at module level to skip the class lookups.
+_MV_STILL = Moves.STILL
+_WIN_DIST = NCons.WIN_DIST
+_LOSE_DIST = NCons.LOSE_DIST
+_NOT_AFRAID_PROB = NCons.NOT_AFRAID_PROBABILITY
+
+logger = logging.getLogger(__name__)
+
 # endregion.
 
 # region Alien Class.
@@ -54,11 +61,54 @@ class Alien:  # pylint: disable=too-few-public-methods
         cs_game (CosmicStandoff): Instance of the CosmicStandoff class.
     """
 
+    __slots__ = ("cs_game", "_moves_table", "_rng")
+
     cs_game: CosmicStandoff
+    _moves_table: dict[str, tuple[Callable[[], Any], ...]]
+    _rng: random.Random
+
+    # Arguments for '_pursue_captain()' when chasing along each axis.
+    _MOVE_X = (Moves.LEFT, Moves.RIGHT, Pos.X_OFFSET)
+    _MOVE_Y = (Moves.DOWN, Moves.UP, Pos.Y_OFFSET)
+    _CHASE_AXES = (_MOVE_X, _MOVE_Y)
+
+    # The Alien's response to each Captain move in '_attack()'.
+    _ATTACK_RESPONSE: dict[str, str] = {
+        Moves.UP: Moves.DOWN,
+        Moves.DOWN: Moves.UP,
+        Moves.LEFT: Moves.RIGHT,
+        Moves.RIGHT: Moves.LEFT,
+    }
+
+    # Move strategy for each (win, lose, flee) bitmask built in '_decide_move()'.
+    # None marks the close-to-lose case, decided by '_select_close_to_lose_move()'.
+    _DECISION_TABLE: tuple[str | None, ...] = (
+        AlienMoves.RANDOM,  # 000
+        AlienMoves.AGGRESSIVE_FLEE,  # 001
+        None,  # 010
+        None,  # 011
+        AlienMoves.CLOSE_TO_WIN,  # 100
+        AlienMoves.CLOSE_TO_WIN,  # 101
+        AlienMoves.CLOSE_TO_WIN,  # 110
+        AlienMoves.CLOSE_TO_WIN,  # 111
+    )
 
     def __init__(self, cs_game: CosmicStandoff) -> None:
-        """Initializes the Alien with a reference to the game instance."""
+        """Initializes the Alien with a reference to the game instance.
+
+        The move strategies table is built once here, as it does not change
+        during the game. The Alien draws its random choices from its own
+        random number generator.
+        """
         self.cs_game = cs_game
+        self._rng = random.Random()
+        self._moves_table = {
+            AlienMoves.CLOSE_TO_WIN: (self._close_to_win,),
+            AlienMoves.NOT_AFRAID_TO_LOSE: (self._attack, self._chase, self._random),
+            AlienMoves.AFRAID_TO_LOSE: (self._flee, self._freeze_move),
+            AlienMoves.AGGRESSIVE_FLEE: (self._attack, self._chase, self._flee),
+            AlienMoves.RANDOM: (self._random,),
+        }
 
     def alien_turn(self) -> None:
         """Handles the Alien's turn.
@@ -66,98 +116,84 @@ class Alien:  # pylint: disable=too-few-public-methods
         Processes the Alien's move, updates and displays its position,
         updates the distances, and logs the current board status.
         """
-        if self.cs_game.is_turn_possible():
-            self._select_move()
-            self.cs_game.update_character_board(Turns.ALIEN_MOVE, Chars.ALIEN)
+        cs_game = self.cs_game
+        if cs_game.is_turn_possible():
+            self._select_move(cs_game.x_dist, cs_game.y_dist)
+            cs_game.update_character_board(Turns.ALIEN_MOVE, Chars.ALIEN)
             self._render_alien_move()
-            self.cs_game.update_distance()
-            self.cs_game.log_board_status()
+            cs_game.update_distance()
+            cs_game.log_board_status()
 
-    def _select_move(self) -> None:
+    def _select_move(self, x_dist: int, y_dist: int) -> None:
         """Executes the Alien's turn by selecting and performing a move.
 
         A move is chosen randomly from a set of available strategies
-        determined by '_decide_move()'.
-        """
-        print("\nThe Alien is deciding its move.")
-        time.sleep(NCons.SHORT_PAUSE)
+        determined by '_decide_move()'. The move is computed before the
+        pause shown to the player, and the pause is skipped when the game
+        is not interactive.
 
-        selected_move = random.choice(self._decide_move())
+        Args:
+            x_dist: The current distance between the Captain and Alien on the X axis.
+            y_dist: The current distance between the Captain and Alien on the Y axis.
+        """
+        selected_move = self._rng.choice(self._decide_move(x_dist, y_dist))
         selected_move()
 
-        logging.info(
+        print("\nThe Alien is deciding its move.")
+        if self.cs_game.interactive:
+            time.sleep(NCons.SHORT_PAUSE)
+
+        logger.info(
             "The Alien called %s: %s.", selected_move.__name__, self.cs_game.turns[Turns.ALIEN_MOVE]
         )
 
         # Alien is the last to move. Used to declare the winner if the distance is 0.
         self.cs_game.turns[Turns.WHO_LAST] = Chars.ALIEN
 
-    def _decide_move(self) -> list[Callable[[], Any]]:
+    def _decide_move(self, x_dist: int, y_dist: int) -> tuple[Callable[[], Any], ...]:
         """Determines the alien's move based on predefined conditions.
 
-        Returns:
-            A list of move functions selected according to the game strategy.
-        """
-        move_condition = self._move_conditions()
-        alien_moves = self._alien_moves()
-
-        if move_condition[AlienMovesCond.WIN_CONDITION]:
-            return alien_moves[AlienMoves.CLOSE_TO_WIN]
-        if move_condition[AlienMovesCond.CLOSE_TO_LOSE_CONDITION]:
-            return self._select_close_to_lose_move(alien_moves)
-        if move_condition[AlienMovesCond.AGGRESSIVE_FLEE_CONDITION]:
-            return alien_moves[AlienMoves.AGGRESSIVE_FLEE]
-        return alien_moves[AlienMoves.RANDOM]
-
-    def _move_conditions(self) -> dict[AlienMovesCond, bool]:
-        """Stores the Alien's movement conditions in a dictionary.
-
         The viability of each move strategy is based on the distances between
-        the Captain and Alien.
+        the Captain and Alien. The conditions are checked in priority order,
+        so the later ones are only evaluated when the earlier ones fail. They
+        are then packed into a bitmask that indexes '_DECISION_TABLE'.
+
+        Args:
+            x_dist: The current distance between the Captain and Alien on the X axis.
+            y_dist: The current distance between the Captain and Alien on the Y axis.
 
         Returns:
-            A dictionary with the conditions to be met for the alien to move.
+            A tuple of move functions selected according to the game strategy.
         """
-        distances = self.cs_game.retrieve_distances()
-
-        return {
-            AlienMovesCond.WIN_CONDITION: NCons.WIN_DIST in distances,
-            AlienMovesCond.CLOSE_TO_LOSE_CONDITION: NCons.LOSE_DIST in distances,
-            AlienMovesCond.AGGRESSIVE_FLEE_CONDITION: any(
-                NCons.LOSE_DIST < dist < self.cs_game.board_config[BConfig.START_DIST]
-                for dist in distances
-            ),
-        }
+        distances = (x_dist, y_dist)
+        win = _WIN_DIST in distances
+        lose = not win and _LOSE_DIST in distances
 
-    def _alien_moves(self) -> dict[AlienMoves, list[Callable[[], Any]]]:
-        """Stores the Alien's move strategies in a dictionary.
+        if win or lose:
+            flee = False
+        else:
+            start_dist = self.cs_game.start_distance
+            flee = _LOSE_DIST < x_dist < start_dist or _LOSE_DIST < y_dist < start_dist
 
-        Returns:
-            A dictionary mapping each move strategy to its corresponding list
-            of functions that implement them.
-        """
-        return {
-            AlienMoves.CLOSE_TO_WIN: [self._close_to_win],
-            AlienMoves.NOT_AFRAID_TO_LOSE: [self._attack, self._chase, self._random],
-            AlienMoves.AFRAID_TO_LOSE: [self._flee, self._freeze_move],
-            AlienMoves.AGGRESSIVE_FLEE: [self._attack, self._chase, self._flee],
-            AlienMoves.RANDOM: [self._random],
-        }
+        strategy = self._DECISION_TABLE[(win << 2) | (lose << 1) | flee]
+        if strategy is None:
+            return self._select_close_to_lose_move(self._moves_table)
+        return self._moves_table[strategy]
 
     def _select_close_to_lose_move(
-        self, alien_moves: dict[AlienMoves, list[Callable[[], Any]]]
-    ) -> list[Callable[[], Any]]:
-        """Selects a list of moves when the Alien is at risk of losing.
+        self, alien_moves: dict[str, tuple[Callable[[], Any], ...]]
+    ) -> tuple[Callable[[], Any], ...]:
+        """Selects a tuple of moves when the Alien is at risk of losing.
 
         Args:
-            alien_moves: A dictionary containing lists of functions for each
+            alien_moves: A dictionary containing tuples of functions for each
                 move strategy.
 
         Returns:
-            A list of functions representing the Alien's selected move, based
+            A tuple of functions representing the Alien's selected move, based
                 on a bold or defensive strategy.
         """
-        if random.random() <= NCons.NOT_AFRAID_PROBABILITY:
+        if self._rng.random() <= _NOT_AFRAID_PROB:
             return alien_moves[AlienMoves.NOT_AFRAID_TO_LOSE]
         return alien_moves[AlienMoves.AFRAID_TO_LOSE]
 
@@ -167,12 +203,13 @@ class Alien:  # pylint: disable=too-few-public-methods
         If the Alien is exactly one unit away from the Captain, it moves
         toward the Captain to secure victory.
         """
-        if self.cs_game.distance[Dist.Y_DIST] == NCons.WIN_DIST:
-            self._pursue_captain(Moves.DOWN, Moves.UP, Coords.Y_COORD)
-        elif self.cs_game.distance[Dist.X_DIST] == NCons.WIN_DIST:
-            self._pursue_captain(Moves.LEFT, Moves.RIGHT, Coords.X_COORD)
+        cs_game = self.cs_game
+        if cs_game.y_dist == _WIN_DIST:
+            self._pursue_captain(*self._MOVE_Y)
+        elif cs_game.x_dist == _WIN_DIST:
+            self._pursue_captain(*self._MOVE_X)
 
-    def _pursue_captain(self, move_neg: Moves, move_pos: Moves, coord: Coords) -> None:
+    def _pursue_captain(self, move_neg: str, move_pos: str, offset: int) -> None:
         """Determines and stores the Alien's movement toward the Captain.
 
         Args:
@@ -180,43 +217,36 @@ class Alien:  # pylint: disable=too-few-public-methods
                 position on the given coordinate is greater than the Captain's.
             move_pos: The move (Moves.UP or Moves.RIGHT) to take if the Alien's
                 position on the given coordinate is lesser than the Captain's.
-            coord: The coordinate (Coords.X_COORD or Coords.Y_COORD) used for
-                comparison.
+            offset: The offset of the coordinate (Pos.X_OFFSET or Pos.Y_OFFSET)
+                used for comparison.
         """
+        positions = self.cs_game.positions
         self.cs_game.turns[Turns.ALIEN_MOVE] = (
             move_neg
-            if self.cs_game.board[Chars.ALIEN][coord] > self.cs_game.board[Chars.CAP][coord]
+            if positions[Pos.ALIEN_X + offset] > positions[Pos.CAP_X + offset]
             else move_pos
         )
 
     def _freeze_move(self) -> None:
         """Sets the Alien's move to 'Moves.STILL', indicating no movement."""
-        self.cs_game.turns[Turns.ALIEN_MOVE] = Moves.STILL
+        self.cs_game.turns[Turns.ALIEN_MOVE] = _MV_STILL
 
     def _random(self) -> None:
         """Moves the Alien in a random direction."""
-        movements = list(Moves)
-        self.cs_game.turns[Turns.ALIEN_MOVE] = random.choice(movements)
+        self.cs_game.turns[Turns.ALIEN_MOVE] = self._rng.choice(_ALL_MOVES)
 
     def _attack(self) -> None:
         """Moves the Alien in direct response to the Captain's movement."""
-        match self.cs_game.turns[Turns.CAP_MOVE]:
-            case Moves.UP:
-                self.cs_game.turns[Turns.ALIEN_MOVE] = Moves.DOWN
-            case Moves.DOWN:
-                self.cs_game.turns[Turns.ALIEN_MOVE] = Moves.UP
-            case Moves.LEFT:
-                self.cs_game.turns[Turns.ALIEN_MOVE] = Moves.RIGHT
-            case Moves.RIGHT:
-                self.cs_game.turns[Turns.ALIEN_MOVE] = Moves.LEFT
-            case Moves.STILL:
-                self._random()
-            case _:
-                logging.warning(
-                    "Unexpected Captain move: %s in %s.",
-                    self.cs_game.turns[Turns.CAP_MOVE],
-                    self._attack.__name__,
-                )
+        turns = self.cs_game.turns
+        cap_move = turns[Turns.CAP_MOVE]
+        response = self._ATTACK_RESPONSE.get(cap_move)
+
+        if response is not None:
+            turns[Turns.ALIEN_MOVE] = response
+        elif cap_move == _MV_STILL:
+            self._random()
+        else:
+            logger.warning("Unexpected Captain move: %s in %s.", cap_move, self._attack.__name__)
 
     def _chase(self) -> None:
         """Moves the Alien toward the Captain based on their distances.
@@ -225,21 +255,22 @@ class Alien:  # pylint: disable=too-few-public-methods
         is greatest. If both distances are equal, it randomly chooses
         between the X or Y direction.
         """
-        move_x = (Moves.LEFT, Moves.RIGHT, Coords.X_COORD)
-        move_y = (Moves.DOWN, Moves.UP, Coords.Y_COORD)
+        cs_game = self.cs_game
+        x_dist, y_dist = cs_game.x_dist, cs_game.y_dist
 
-        if self.cs_game.distance[Dist.X_DIST] > self.cs_game.distance[Dist.Y_DIST]:
-            self._pursue_captain(*move_x)
-        elif self.cs_game.distance[Dist.X_DIST] < self.cs_game.distance[Dist.Y_DIST]:
-            self._pursue_captain(*move_y)
+        if x_dist > y_dist:
+            self._pursue_captain(*self._MOVE_X)
+        elif x_dist < y_dist:
+            self._pursue_captain(*self._MOVE_Y)
         else:
-            self._pursue_captain(*random.choice((move_x, move_y)))
+            self._pursue_captain(*self._CHASE_AXES[self._rng.getrandbits(1)])
 
     def _flee(self) -> None:
         """Moves the Alien away from the Captain."""
-        cap_move = self.cs_game.turns[Turns.CAP_MOVE]
-        if cap_move != Moves.STILL:
-            self.cs_game.turns[Turns.ALIEN_MOVE] = cap_move
+        turns = self.cs_game.turns
+        cap_move = turns[Turns.CAP_MOVE]
+        if cap_move != _MV_STILL:
+            turns[Turns.ALIEN_MOVE] = cap_move
         else:
             self._random()
 
@@ -247,7 +278,7 @@ class Alien:  # pylint: disable=too-few-public-methods
         """Displays the Alien new positions to the player."""
         alien_move = self.cs_game.turns[Turns.ALIEN_MOVE]
 
-        if alien_move == Moves.STILL:
+        if alien_move == _MV_STILL:
             print(f"\nAlien stayed '{alien_move}'.")
             print("The positions did not change, Captain:")
         else:
@@ -13,6 +13,7 @@ logging the current board status and updating distances.
 from __future__ import annotations
 
 import logging
+import sys
 from textwrap import dedent
 from typing import TYPE_CHECKING
 
@@ -22,11 +23,26 @@ if TYPE_CHECKING:
     from cosmic_standoff import CosmicStandoff
 
 
-# Aliases for the relevant Enums of constants.py.
+# Aliases for the relevant constant classes of constants.py.
 Chars = cons.Characters
 Moves = cons.Moves
 Turns = cons.Turns
 
+# Move options offered to the player, built once instead of on every turn.
+_MOVE_OPTIONS = Moves.ALL
+_MAIN_MOVES_STR = ", ".join(_MOVE_OPTIONS[:-1])
+_NO_MOVE = _MOVE_OPTIONS[-1]
+_MOVE_OPTIONS_SET = frozenset(_MOVE_OPTIONS)
+
+_MOVE_PROMPT = dedent(
+    f"""
+    Captain, where do you want to move?
+    Type {_MAIN_MOVES_STR} to move, or {_NO_MOVE} to stay in place.
+"""
+)
+
+logger = logging.getLogger(__name__)
+
 # endregion.
 
 # region Captain Class.
@@ -43,6 +59,8 @@ class Captain:  # pylint: disable=too-few-public-methods
         cs_game (CosmicStandoff): Instance of the CosmicStandoff class.
     """
 
+    __slots__ = ("cs_game",)
+
     cs_game: CosmicStandoff
 
     def __init__(self, cs_game: CosmicStandoff) -> None:
@@ -56,63 +74,39 @@ class Captain:  # pylint: disable=too-few-public-methods
         Captain's position, updates the distances, and logs the current
         board status.
         """
-        if self.cs_game.is_turn_possible():
+        cs_game = self.cs_game
+        if cs_game.is_turn_possible():
             self._prompt_captain_move()
-            self.cs_game.update_character_board(Turns.CAP_MOVE, Chars.CAP)
+            cs_game.update_character_board(Turns.CAP_MOVE, Chars.CAP)
             self._render_captain_move()
-            self.cs_game.update_distance()
-            self.cs_game.log_board_status()
+            cs_game.update_distance()
+            cs_game.log_board_status()
 
     def _prompt_captain_move(self) -> None:
         """Prompts the player to choose a move and validates the input."""
-        move_options = list(Moves)
-        main_moves, no_move = ", ".join(move_options[:-1]), move_options[-1]
-
-        self._print_captain_move_prompt(main_moves, no_move)
-        self._get_captain_move(move_options, main_moves, no_move)
+        print(_MOVE_PROMPT, end="")
+        self._get_captain_move()
 
         # Captain is the last to move. Used to declare the winner if the distance is 0.
         self.cs_game.turns[Turns.WHO_LAST] = Chars.CAP
 
-    def _print_captain_move_prompt(self, main_moves: str, no_move: str) -> None:
-        """Displays the move options to the player.
-
-        Args:
-            main_moves: " 'Up', 'Down', 'Left', 'Right' ".
-            no_move: 'Still'.
-        """
-        print(
-            dedent(
-                f"""
-            Captain, where do you want to move?
-            Type {main_moves} to move, or {no_move} to stay in place.
-        """
-            ),
-            end="",
-        )
-
-    def _get_captain_move(self, move_options: list[Moves], main_moves: str, no_move: str) -> None:
-        """Gets and validates the player's move input.
-
-        Args:
-            move_options: ['Up', 'Down', 'Left', 'Right', 'Still'].
-            main_moves: " 'Up', 'Down', 'Left', 'Right' ".
-            no_move: 'Still'.
-        """
+    def _get_captain_move(self) -> None:
+        """Gets and validates the player's move input."""
         # Local variable instead of constant CAP_MOVE for readability.
         # Resets to ensure the loop below runs on each turn.
         cap_move = cons.EMPTY_STRING
 
-        while cap_move not in move_options:
+        while cap_move not in _MOVE_OPTIONS_SET:
             cap_move = input().lower().capitalize()
 
-            if cap_move not in move_options:
+            if cap_move not in _MOVE_OPTIONS_SET:
                 print(f"\n'{cap_move}' is not a valid move, Captain.")
-                print(f"Choose between: {main_moves}, or {no_move}.")
+                print(f"Choose between: {_MAIN_MOVES_STR}, or {_NO_MOVE}.")
 
-        # Updates the game state.
-        self.cs_game.turns[Turns.CAP_MOVE] = cap_move
-        logging.info("Captain choice: %s.", cap_move)
+        # Updates the game state. Interning the typed move makes later lookups keyed
+        # by it compare by identity against the string constants.
+        self.cs_game.turns[Turns.CAP_MOVE] = sys.intern(cap_move)
+        logger.info("Captain choice: %s.", cap_move)
 
     def _render_captain_move(self) -> None:
         """Displays the Captain new positions to the player."""
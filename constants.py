@@ -4,11 +4,13 @@
 """Constants and configuration values for the Cosmic Standoff program.
 
 This module stores fixed values to avoid hardcoding them throughout the
-project.
+project. The labels are grouped in plain classes rather than Enums, so the
+game reads them as ordinary class attributes holding 'str' and 'int' values.
 """
 
+# pylint: disable=too-few-public-methods
+
 import os
-from enum import IntEnum, StrEnum
 
 # endregion.
 
@@ -39,9 +41,12 @@ How to Win:
 
 EMPTY_STRING = ""
 
+# Directory of the project, resolved once for all the paths below.
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
 
-class NumericalConstants(IntEnum):
-    """Enum defining labels for the numerical values used in the game.
+class NumericalConstants:
+    """Constants defining labels for the numerical values used in the game.
 
     Attributes:
         MIN_BOARD (int): Min board size to ensure enough moves before game ends.
@@ -58,7 +63,7 @@ class NumericalConstants(IntEnum):
         WIN_DIST (int): Distance indicating Captain and are 1 unit apart.
         LONG_PAUSE (int): Duration for a long pause, in seconds.
         SHORT_PAUSE (int): Duration for a short pause, in seconds.
-        NOT_AFRAID_PROBABILITY (int): Probability that the Alien will make an
+        NOT_AFRAID_PROBABILITY (float): Probability that the Alien will make an
             unpredictable move, instead of taking a defensive move.
     """
 
@@ -79,74 +84,79 @@ class NumericalConstants(IntEnum):
     NOT_AFRAID_PROBABILITY = 0.2
 
 
-class Paths(StrEnum):
-    """Enum defining labels for the paths used in the game.
+class Paths:
+    """Constants defining labels for the paths used in the game.
 
     Attributes:
+        SCORE_DIR (str): The path to the directory of the score file.
         SCORE_PATH (str): The path to the score file.
         LOG_PATH (str): The path to the logging file.
     """
 
-    SCORE_PATH = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), "c_standoff_score/score.json"
-    )
-    LOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "log_file.txt")
+    SCORE_DIR = os.path.join(_HERE, "c_standoff_score")
+    SCORE_PATH = os.path.join(SCORE_DIR, "score.json")
+    LOG_PATH = os.path.join(_HERE, "log_file.txt")
 
 
-class Characters(StrEnum):
-    """Enum defining labels for the characters of the game.
+class Characters:
+    """Constants defining labels for the characters of the game.
 
     Attributes:
         CAP (str): The Captain character.
         ALIEN (str): The Alien character.
+        ALL (tuple[str, ...]): All the characters, in declaration order.
     """
 
     CAP = "Captain"
     ALIEN = "Alien"
+    ALL = (CAP, ALIEN)
 
 
-class Coordinates(StrEnum):
-    """Enum defining labels for the coordinate values of the board.
+class Coordinates:
+    """Constants defining labels for the coordinate values of the board.
 
     Attributes:
         X (str): Label for the X coordinate.
         Y (str): Label for the Y coordinate.
+        ALL (tuple[str, ...]): All the coordinate labels, in declaration order.
     """
 
     X_COORD = "X"
     Y_COORD = "Y"
+    ALL = (X_COORD, Y_COORD)
 
 
-class BoardConfig(StrEnum):
-    """Enum defining labels for the board initial configuration settings.
-
-    Attributes:
-        MIN_COORD (str): Label for the minimum coordinate for placing characters.
-        MAX_COORD (str): Label for the maximum coordinate for placing characters.
-        BOARD_SIZE (str): Label for the board size ((max_coord - min_coord) + 1).
-        START_DIST (str): Label for the initial distance between the characters.
-    """
-
-    MIN_COORD = "min_coord"
-    MAX_COORD = "max_coord"
-    BOARD_SIZE = "board_size"
-    START_DIST = "start_distance"
-
+class Positions:
+    """Constants defining the layout of the characters' coordinates.
 
-class Distance(StrEnum):
-    """Enum defining labels for the distances between the characters.
+    The coordinates of both characters are stored in a single flat list,
+    the Captain's first and the Alien's after, each as an (X, Y) pair.
 
     Attributes:
-        X_DIST (str): Label for the dynamic distance on the x axis.
-        Y_DIST (str): Label for the dynamic distance on the y axis.
+        X_OFFSET (int): Offset of the X coordinate within a character's pair.
+        Y_OFFSET (int): Offset of the Y coordinate within a character's pair.
+        OFFSETS (tuple[int, ...]): All the coordinate offsets, in (X, Y) order.
+        CAP_X (int): Index of the Captain's X coordinate.
+        CAP_Y (int): Index of the Captain's Y coordinate.
+        ALIEN_X (int): Index of the Alien's X coordinate.
+        ALIEN_Y (int): Index of the Alien's Y coordinate.
+        SIZE (int): Number of coordinates stored.
+        BASE (dict[str, int]): Index of the first coordinate of each character.
     """
 
-    X_DIST = "x_distance"
-    Y_DIST = "y_distance"
+    X_OFFSET = 0
+    Y_OFFSET = 1
+    OFFSETS = (X_OFFSET, Y_OFFSET)
+    CAP_X = 0
+    CAP_Y = 1
+    ALIEN_X = 2
+    ALIEN_Y = 3
+    SIZE = 4
+    BASE = {Characters.CAP: CAP_X, Characters.ALIEN: ALIEN_X}
 
 
-class Turns(StrEnum):
-    """Enum defining labels for the turns-related data used in the game.
+class Turns:
+    """Constants defining labels for the turns-related data used in the game.
 
     Attributes:
         WHO_STARTS (str): Label for who makes the first move (randomly decided).
@@ -154,16 +164,18 @@ class Turns(StrEnum):
         CAP_MOVE (str): Label for the possible moves the Captain can make.
             Can be ('Up', 'Down', 'Left', 'Right', or 'Still').
         ALIEN_MOVE (str): Same as CAPTAIN_MOVE.
+        ALL (tuple[str, ...]): All the turn labels, in declaration order.
     """
 
     WHO_STARTS = "who_starts"
     WHO_LAST = "who_last"
     CAP_MOVE = "captain_move"
     ALIEN_MOVE = "alien_move"
+    ALL = (WHO_STARTS, WHO_LAST, CAP_MOVE, ALIEN_MOVE)
 
 
-class Moves(StrEnum):
-    """Enum defining labels for the moves the Captain and Alien can make.
+class Moves:
+    """Constants defining labels for the moves the Captain and Alien can make.
 
     Attributes:
         UP (str): Up move.
@@ -171,6 +183,7 @@ class Moves(StrEnum):
         LEFT (str): Left move.
         RIGHT (str): Right move.
         STILL (str): Still move.
+        ALL (tuple[str, ...]): All the moves, in declaration order.
     """
 
     UP = "Up"
@@ -178,22 +191,25 @@ class Moves(StrEnum):
     LEFT = "Left"
     RIGHT = "Right"
     STILL = "Still"
+    ALL = (UP, DOWN, LEFT, RIGHT, STILL)
 
 
-class Flags(StrEnum):
-    """Enum defining labels for the game logic flags used in the game.
+class Flags:
+    """Constants defining labels for the game logic flags used in the game.
 
     Attributes:
         START_TURNS (str): Label for the flag to control the turn-based loop.
         NEW_GAME (str): Label for the flag to start a new game.
+        ALL (tuple[str, ...]): All the flag labels, in declaration order.
     """
 
     START_TURNS = "start_turns"
     NEW_GAME = "new_play"
+    ALL = (START_TURNS, NEW_GAME)
 
 
-class AlienMoves(StrEnum):
-    """Enum defining labels for the Alien's movement strategies.
+class AlienMoves:
+    """Constants defining labels for the Alien's movement strategies.
 
     Attributes:
         RANDOM (str): Label for a strategy where the Alien moves randomly.
@@ -214,21 +230,4 @@ class AlienMoves(StrEnum):
     CLOSE_TO_WIN = "close_to_win"
 
 
-class AlienMovesConditions(StrEnum):
-    """Enum defining labels for conditions to pick the Alien's strategy.
-
-    Attributes:
-        WIN_CONDITION (str): Label for the condition when the Alien is close to
-            winning.
-        CLOSE_TO_LOSE_CONDITION (str): Label for the condition when the Alien
-            is close to losing.
-        AGGRESSIVE_FLEE_CONDITION (str): Label for the condition when the Alien
-            should use an aggressive or flee strategy.
-    """
-
-    WIN_CONDITION = "win_condition"
-    CLOSE_TO_LOSE_CONDITION = "lose_condition"
-    AGGRESSIVE_FLEE_CONDITION = "aggressive_flee_condition"
-
-
 # endregion.
@@ -17,84 +17,192 @@ the Alien.
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
 import os
 import random
 import sys
 import time
-from textwrap import dedent
-from typing import Literal, cast
-
-import pyinputplus as pyip  # type: ignore  # pylint: disable=import-error
+from typing import Any, Callable
 
 import constants as cons
 import logging_file
 from alien import Alien
 from captain import Captain
 
-# Aliases for all the Enums of constants.py.
+# Aliases for all the constant classes of constants.py.
 AlienMoves = cons.AlienMoves
-AlienMovesCond = cons.AlienMovesConditions
-BConfig = cons.BoardConfig
 Chars = cons.Characters
 Coords = cons.Coordinates
-Dist = cons.Distance
 Flags = cons.Flags
 Moves = cons.Moves
 NCons = cons.NumericalConstants
 Paths = cons.Paths
+Pos = cons.Positions
 Turns = cons.Turns
 
-logging_file.logging_configuration()
-# logging_file.disable_logging()
+# The coordinate offset and step each move applies to a character's position.
+# Still moves nowhere.
+_MOVE_DELTA: dict[str, tuple[int, int] | None] = {
+    Moves.UP: (Pos.Y_OFFSET, NCons.UNIT_INC),
+    Moves.DOWN: (Pos.Y_OFFSET, -NCons.UNIT_DEC),
+    Moves.LEFT: (Pos.X_OFFSET, -NCons.UNIT_DEC),
+    Moves.RIGHT: (Pos.X_OFFSET, NCons.UNIT_INC),
+    Moves.STILL: None,
+}
+
+# Static display strings, formatted once instead of on every game.
+_BOARD_INSTRUCTIONS = (
+    "\nHow large should the board be at the start of the game?\n\n"
+    "Provide the minimum and maximum coordinates, "
+    f"at least {NCons.MIN_BOARD} units apart.\n\n"
+    "Example:\n"
+    f"({NCons.MIN_COORD_EX}, {NCons.MAX_COORD_EX}) spans {NCons.SPAN} units.\n\n"
+    "Note: A larger difference between the coordinates may increase game duration.\n"
+)
+_FIRST_TURN_INTRO = (
+    "\nThe stars have aligned, Captain.\n"
+    "The Universe rolls the dice to decide who takes the first move.\n\n"
+    "Let's wait...\n"
+)
+
+logger = logging.getLogger(__name__)
+
+
+# endregion.
+
+
+# region Score Serialization.
+
+
+@functools.cache
+def _json_codec() -> tuple[Callable[[bytes], Any], Callable[[Any], bytes]]:
+    """Imports the JSON library for the score file on first use.
+
+    'orjson' is used when it is installed, falling back to the standard
+    'json' module otherwise. The choice is cached, so a missing 'orjson' is
+    only looked up once.
+
+    Returns:
+        The functions to decode the score from bytes and encode it to bytes.
+    """
+    # pylint: disable=import-outside-toplevel
+    try:
+        import orjson  # type: ignore  # pylint: disable=import-error
+    except ImportError:
+        import json
+
+        return json.loads, lambda obj: json.dumps(obj).encode()
+    return orjson.loads, orjson.dumps  # pylint: disable=no-member
 
 
 # endregion.
 
 
 # region CosmicStandoff Class.
-class CosmicStandoff:
+class CosmicStandoff:  # pylint: disable=too-many-instance-attributes
     """Manages the setup and execution of a terminal turn-based game.
 
     Handles game initialization, board configurations, turn-based moves,
     and victory determination.
 
     Attributes:
-        board (dict[Chars, dict[Coords, int]]): Stores the Captain and Alien's coordinates.
-        board_config (dict[BConfig, int]): Board initial configuration settings.
-        distance (dict[Dist, int]): Dynamic X and Y distances between the Captain and Alien.
-        turns (dict[Turns, str]): Game's turn-related data.
-        flags (dict[Flags, bool]): Contains logic flags for game flow control.
+        positions (list[int]): Stores the Captain and Alien's coordinates, laid
+            out as described by 'Pos'.
+        min_coord (int): Minimum coordinate for placing the characters.
+        max_coord (int): Maximum coordinate for placing the characters.
+        board_size (int): Board size ((max_coord - min_coord) + 1).
+        start_distance (int): Initial distance between the characters.
+        x_dist (int): Dynamic distance between the Captain and Alien on the X axis.
+        y_dist (int): Dynamic distance between the Captain and Alien on the Y axis.
+        turns (dict[str, str]): Game's turn-related data.
+        flags (dict[str, bool]): Contains logic flags for game flow control.
         score (dict[str, int]): Tracks the scores for the Captain and Alien.
-        instances (dict[Chars, Captain | Alien]): Instances of the Captain and Alien classes.
+        captain (Captain): Instance of the Captain class.
+        alien (Alien): Instance of the Alien class.
+        instances (dict[str, Captain | Alien]): Instances of the Captain and Alien classes.
+        _turn_order (dict[str, tuple[Callable[[], None], ...]]): The Captain and
+            Alien turns, in the order they are played for each starter.
+        _win_handler (dict[str, Callable[[], None]]): The victory message for
+            each winner.
+        interactive (bool): Whether the game pauses for the player to follow the
+            Alien's turn. Disable it for scripted or simulated games.
     """
 
-    board: dict[Chars, dict[Coords, int]]
-    board_config: dict[BConfig, int]
-    distance: dict[Dist, int]
-    turns: dict[Turns, str]
-    flags: dict[Flags, bool]
+    __slots__ = (
+        "positions",
+        "min_coord",
+        "max_coord",
+        "board_size",
+        "start_distance",
+        "x_dist",
+        "y_dist",
+        "turns",
+        "flags",
+        "score",
+        "captain",
+        "alien",
+        "instances",
+        "_turn_order",
+        "_win_handler",
+        "interactive",
+        "_score_dir_ready",
+        "_score_loaded",
+    )
+
+    positions: list[int]
+    min_coord: int
+    max_coord: int
+    board_size: int
+    start_distance: int
+    x_dist: int
+    y_dist: int
+    turns: dict[str, str]
+    flags: dict[str, bool]
     score: dict[str, int]
-    instances: dict[Chars, Captain | Alien]
+    captain: Captain
+    alien: Alien
+    instances: dict[str, Captain | Alien]
+    _turn_order: dict[str, tuple[Callable[[], None], ...]]
+    _win_handler: dict[str, Callable[[], None]]
+    interactive: bool
+    _score_dir_ready: bool
+    _score_loaded: bool
+
+    def __init__(self, interactive: bool = True) -> None:
+        """Initializes the game attributes.
 
-    def __init__(self) -> None:
-        """Initializes the game attributes."""
-        self.board = {
-            character: {coord: NCons.START_VAL for coord in Coords} for character in Chars
+        Args:
+            interactive: Whether the game pauses for the player to follow the
+                Alien's turn.
+        """
+        self.positions = [NCons.START_VAL] * Pos.SIZE
+        self.min_coord = NCons.START_VAL
+        self.max_coord = NCons.START_VAL
+        self.board_size = NCons.START_VAL
+        self.start_distance = NCons.START_VAL
+        self.x_dist = NCons.START_VAL
+        self.y_dist = NCons.START_VAL
+        self.turns = {turn_data: cons.EMPTY_STRING for turn_data in Turns.ALL}
+        self.flags = {flag: False for flag in Flags.ALL}
+        self.score = {character: NCons.START_VAL for character in Chars.ALL}
+        self.captain = Captain(self)
+        self.alien = Alien(self)
+        self.instances = {Chars.CAP: self.captain, Chars.ALIEN: self.alien}
+        # Dispatch tables built once, so each turn and each win is a single lookup.
+        self._turn_order = {
+            Chars.CAP: (self.captain.captain_turn, self.alien.alien_turn),
+            Chars.ALIEN: (self.alien.alien_turn, self.captain.captain_turn),
         }
-        self.board_config = {config: NCons.START_VAL for config in BConfig}
-        self.distance = {distance: NCons.START_VAL for distance in Dist}
-        self.turns = {turn_data: cons.EMPTY_STRING for turn_data in Turns}
-        self.flags = {flag: False for flag in Flags}
-        self.score = {character: NCons.START_VAL for character in Chars}
-        self.instances = {Chars.CAP: Captain(self), Chars.ALIEN: Alien(self)}
+        self._win_handler = {Chars.CAP: self._captain_won, Chars.ALIEN: self._alien_won}
+        self.interactive = interactive
+        self._score_dir_ready = False
+        self._score_loaded = False
 
     def intro(self) -> None:
         """Displays the introduction to the game."""
         try:
-            logging.debug("Starting the game.")
-            print(input(cons.INTRO))
+            input(cons.INTRO)
         except KeyboardInterrupt:
             self._exit_game()
 
@@ -105,7 +213,14 @@ class CosmicStandoff:
         starts by initializing the game sequence, then enters a turn-
         based loop where the Captain and Alien take turns moving. The
         game continues until 'Flags.START_TURNS' is set to False.
+
+        Logging is configured here, so the log file is only created once
+        the player gets past the intro.
         """
+        logging_file.logging_configuration()
+        # logging_file.disable_logging()
+        logger.debug("Starting the game.")
+
         try:
             while True:
                 self._start_game_sequence()
@@ -129,16 +244,30 @@ class CosmicStandoff:
         self._display_initial_positions()
 
     def _read_score(self) -> None:
-        """Reads the score in the JSON file and displays it to the player."""
+        """Reads the score in the JSON file and displays it to the player.
+
+        The file is only read before the first game. The score is kept in
+        memory afterwards and written to the file at the end of every game,
+        so new games display it without reading the file again.
+        """
+        if self._score_loaded:
+            self._display_current_score()
+            return
+
         try:
             victories = self._load_score_from_file(Paths.SCORE_PATH)
-        except (FileNotFoundError, json.JSONDecodeError) as err:
-            logging.warning("Score file issue (%s). Initializing a new score.", err)
+        # Both JSON libraries raise a subclass of ValueError for invalid content.
+        except (FileNotFoundError, ValueError) as err:
+            logger.warning("Score file issue (%s). Initializing a new score.", err)
             self._write_score()
         except OSError as err:
             self._handle_os_error(err)
         else:
-            self._display_current_score(victories)
+            for character in Chars.ALL:
+                self.score[character] += victories[character]
+            self._display_current_score()
+
+        self._score_loaded = True
 
     def _load_score_from_file(self, path: str) -> dict[str, int]:
         """Loads the score from the specified JSON file.
@@ -147,10 +276,13 @@ class CosmicStandoff:
             path: The path of the Json file.
 
         Returns:
-            The content of the JSON file as a dictionary.
+            The content of the JSON file as a dictionary, with interned keys.
         """
-        with open(path, "r", encoding="utf-8") as score_file:
-            return json.load(score_file)
+        loads, _ = _json_codec()
+
+        with open(path, "rb") as score_file:
+            victories = loads(score_file.read())
+        return {sys.intern(character): score for character, score in victories.items()}
 
     def _handle_os_error(self, err: OSError) -> None:
         """Handles OSError.
@@ -158,33 +290,31 @@ class CosmicStandoff:
         Args:
             err: The OSError instance that was raised during file operations.
         """
-        logging.error("Error reading score file: %s", err)
+        logger.error("Error reading score file: %s", err)
         print("An error occurred while reading the score file.")
         print("Check the file permissions and restart the game.")
         self._exit_game()
 
-    def _display_current_score(self, victories: dict[str, int]) -> None:
-        """Displays the current score to the player.
-
-        Args:
-            victories: The scores loaded from the JSON file.
-        """
+    def _display_current_score(self) -> None:
+        """Displays the current score to the player."""
         print("\nCurrent score:\n")
-        for character in self.board:
-            # Loads existing score from JSON to ensure continuity, as self.score
-            # resets after each game to prevent accumulation.
-            self.score[character] += victories[character]
-            print(f"-- {character}: {victories[character]}")
+        for character in Chars.ALL:
+            print(f"-- {character}: {self.score[character]}")
 
     def _write_score(self) -> None:
         """Keeps track of the score in a JSON file."""
-        # Creates the directory only when the program runs for the first time.
-        os.makedirs(os.path.dirname(Paths.SCORE_PATH), exist_ok=True)
+        _, dumps = _json_codec()
 
-        with open(Paths.SCORE_PATH, "w", encoding="utf-8") as score_file:
-            victories = json.dumps(self.score)
+        # Creates the directory only when the program runs for the first time,
+        # and skips the check on later saves in the same session.
+        if not self._score_dir_ready:
+            os.makedirs(Paths.SCORE_DIR, exist_ok=True)
+            self._score_dir_ready = True
+
+        with open(Paths.SCORE_PATH, "wb") as score_file:
+            victories = dumps(self.score)
             score_file.write(victories)
-            logging.info("The score has been written to file.")
+            logger.info("The score has been written to file.")
 
     def _get_board_size(self) -> None:
         """Defines the board size based on player input.
@@ -198,13 +328,14 @@ class CosmicStandoff:
         self._configure_board()
         self._set_starting_distance()
 
-        print(f"Your board size: {self.board_config[BConfig.BOARD_SIZE]} units.")
-        logging.info(
-            "The board is set up. Min: %s, Max: %s, Board size: %s.",
-            self.board_config[BConfig.MIN_COORD],
-            self.board_config[BConfig.MAX_COORD],
-            self.board_config[BConfig.BOARD_SIZE],
-        )
+        print(f"Your board size: {self.board_size} units.")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "The board is set up. Min: %s, Max: %s, Board size: %s.",
+                self.min_coord,
+                self.max_coord,
+                self.board_size,
+            )
 
     def _display_board_instructions(self) -> None:
         """Displays instructions for specifying board coordinates.
@@ -213,20 +344,7 @@ class CosmicStandoff:
         coordinates for the game board. The coordinates must be at least
         10 units apart to ensure the board is playable.
         """
-        print(
-            dedent(
-                f"""
-        How large should the board be at the start of the game?
-
-        Provide the minimum and maximum coordinates, at least {NCons.MIN_BOARD} units apart.
-
-        Example:
-        ({NCons.MIN_COORD_EX}, {NCons.MAX_COORD_EX}) spans {NCons.SPAN} units.
-
-        Note: A larger difference between the coordinates may increase game duration.
-        """
-            )
-        )
+        print(_BOARD_INSTRUCTIONS)
 
     def _configure_board(self) -> None:
         """Prompts the player for valid board coordinates.
@@ -235,18 +353,19 @@ class CosmicStandoff:
         coordinates for the game board until the difference between them
         is at least 10 units, ensuring a playable board size.
         """
-        while self.board_config[BConfig.BOARD_SIZE] < NCons.MIN_BOARD:
-            self.board_config[BConfig.MIN_COORD] = pyip.inputInt("Minimum Coordinate: ")
-            self.board_config[BConfig.MAX_COORD] = pyip.inputInt("Maximum Coordinate: ")
+        # Imported on first use, as the player is only prompted once the game starts.
+        import pyinputplus as pyip  # type: ignore  # pylint: disable=import-error,import-outside-toplevel
+
+        while self.board_size < NCons.MIN_BOARD:
+            self.min_coord = pyip.inputInt("Minimum Coordinate: ")
+            self.max_coord = pyip.inputInt("Maximum Coordinate: ")
 
             # Recalculates the board size.
-            self.board_config[BConfig.BOARD_SIZE] = (
-                self.board_config[BConfig.MAX_COORD] - self.board_config[BConfig.MIN_COORD]
-            ) + NCons.UNIT_INC
+            self.board_size = (self.max_coord - self.min_coord) + NCons.UNIT_INC
 
-            if self.board_config[BConfig.BOARD_SIZE] < NCons.MIN_BOARD:
+            if self.board_size < NCons.MIN_BOARD:
                 print(f"The board size must be at least {NCons.MIN_BOARD} units apart.\n")
-                print(f"You chose a board of {self.board_config[BConfig.BOARD_SIZE]} units.\n")
+                print(f"You chose a board of {self.board_size} units.\n")
 
     def _set_starting_distance(self) -> None:
         """Calculates and sets the starting distance as half the board size.
@@ -255,7 +374,7 @@ class CosmicStandoff:
         sufficient for meaningful gameplay, given the minimum board size
         of 10 units.
         """
-        self.board_config[BConfig.START_DIST] = self.board_config[BConfig.BOARD_SIZE] // NCons.HALF
+        self.start_distance = self.board_size // NCons.HALF
 
     def _place_characters_on_board(self) -> None:
         """Fills the board with the Captain and Alien positions."""
@@ -267,7 +386,7 @@ class CosmicStandoff:
         """Randomly places the Captain on the board."""
         self._set_random_position(Chars.CAP)
 
-    def _set_random_position(self, character: Chars) -> None:
+    def _set_random_position(self, character: str) -> None:
         """Assigns random coordinates to the specified character.
 
         The random values are chosen within the range defined by the board
@@ -277,70 +396,77 @@ class CosmicStandoff:
             character: The character whose coordinates to set
                 ('Chars.CAP' or 'Chars.ALIEN').
         """
-        for coord in self.board[character]:
-            self.board[character][coord] = random.randint(
-                self.board_config[BConfig.MIN_COORD],
-                self.board_config[BConfig.MAX_COORD],
-            )
+        randint = random.randint
+        positions = self.positions
+        min_coord = self.min_coord
+        max_coord = self.max_coord
+        base = Pos.BASE[character]
+
+        for offset in Pos.OFFSETS:
+            positions[base + offset] = randint(min_coord, max_coord)
 
     def _set_alien_position(self) -> None:
         """Randomly positions the Alien on the board.
 
         Ensures that the Alien's starting position away from the Captain
         is at least the required minimum distance, defined by
-        'BConfig.START_DIST'.
+        'start_distance'. Each coordinate is drawn directly from the
+        valid values, so no placement has to be retried.
         """
-        while not self._is_valid_starting_distance():
-            self._set_random_position(Chars.ALIEN)
-            # Recalculates the distance between the Captain and the Alien.
-            self.update_distance()
+        positions = self.positions
+        for offset in Pos.OFFSETS:
+            positions[Pos.ALIEN_X + offset] = self._get_distant_coordinate(
+                positions[Pos.CAP_X + offset]
+            )
+        # Recalculates the distance between the Captain and the Alien.
+        self.update_distance()
+
+    def _get_distant_coordinate(self, cap_coord: int) -> int:
+        """Picks a random coordinate far enough from the Captain's.
 
-    def _is_valid_starting_distance(self) -> bool:
-        """Validates the starting distance between the Captain and Alien.
+        The valid values lie in two ranges of the board, below and above
+        the Captain's coordinate by at least 'start_distance'. One of
+        them is always non-empty, as the starting distance is half the
+        board size. A single draw over both ranges picks every valid value
+        with the same probability.
 
-        Checks whether the distance between the Captain and Alien on both
-        the X and Y axes is at least the required minimum distance, defined
-        by 'BConfig.START_DIST'.
+        Args:
+            cap_coord: The Captain's coordinate on the axis being set.
 
         Returns:
-            True if the distance meets the minimum requirement, False otherwise.
+            The Alien's coordinate on that axis.
         """
-        return all(
-            self.distance[dist] >= self.board_config[BConfig.START_DIST]
-            for dist in (Dist.X_DIST, Dist.Y_DIST)
-        )
+        min_coord = self.min_coord
+        max_coord = self.max_coord
+        start_dist = self.start_distance
 
-    def update_distance(self) -> None:
-        """Updates the X and Y distances between the Captain and Alien."""
-        self.distance[Dist.X_DIST] = self._get_absolute_distance(Coords.X_COORD)
-        self.distance[Dist.Y_DIST] = self._get_absolute_distance(Coords.Y_COORD)
+        # Number of valid values in [min_coord, cap_coord - start_dist].
+        low_count = max(0, cap_coord - start_dist - min_coord + NCons.UNIT_INC)
+        # Number of valid values in [cap_coord + start_dist, max_coord].
+        high_count = max(0, max_coord - cap_coord - start_dist + NCons.UNIT_INC)
 
-    def _get_absolute_distance(self, axis: Coords) -> int:
-        """Computes the absoute distance between Captain and Alien coordinates.
-
-        Args:
-            axis: The axis for which to calculate the distance
-                ('Coords.X_COORD' or 'Coords.Y_COORD').
+        pick = random.randrange(low_count + high_count)
+        if pick < low_count:
+            return min_coord + pick
+        return cap_coord + start_dist + pick - low_count
 
-        Returns:
-            The absolute distance between the Captain and Alien as an integer.
-        """
-        return abs(self.board[Chars.CAP][axis] - self.board[Chars.ALIEN][axis])
+    def update_distance(self) -> None:
+        """Updates the X and Y distances between the Captain and Alien."""
+        positions = self.positions
+        self.x_dist = abs(positions[Pos.CAP_X] - positions[Pos.ALIEN_X])
+        self.y_dist = abs(positions[Pos.CAP_Y] - positions[Pos.ALIEN_Y])
 
     def log_board_status(self) -> None:
-        """Logs the current board status of the Captain and Alien."""
-        positions = [self.board[char][coord] for char in Chars for coord in Coords]
-        distances = self.retrieve_distances()
-        logging.info("Captain board: (X: %s, Y: %s). Alien board: (X: %s, Y: %s).", *positions)
-        logging.info("Updated distance: (X: %s Y: %s).", *distances)
+        """Logs the current board status of the Captain and Alien.
 
-    def retrieve_distances(self) -> tuple[int, int]:
-        """Retrieves the current distances between the Captain and Alien.
-
-        Returns:
-            A tuple containing 'Dist.X_DIST' and 'Dist.Y_DIST' distances.
+        The log arguments are only gathered when INFO records are enabled.
         """
-        return (self.distance[Dist.X_DIST], self.distance[Dist.Y_DIST])
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        log_info = logger.info
+        log_info("Captain board: (X: %s, Y: %s). Alien board: (X: %s, Y: %s).", *self.positions)
+        log_info("Updated distance: (X: %s Y: %s).", self.x_dist, self.y_dist)
 
     def _who_goes_first(self) -> None:
         """Determines who takes the first turn.
@@ -351,9 +477,10 @@ class CosmicStandoff:
         self._display_first_turn_intro()
         time.sleep(NCons.LONG_PAUSE)
 
-        starter = random.choice(list(Chars))
+        starter = random.choice(Chars.ALL)
         print(f"The {starter} goes first.")
-        logging.info("Starter: %s.", starter)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Starter: %s.", starter)
 
         # Updates the game state.
         self.turns[Turns.WHO_STARTS] = starter
@@ -362,16 +489,7 @@ class CosmicStandoff:
 
     def _display_first_turn_intro(self) -> None:
         """Displays an introductory message before the first turn starts."""
-        print(
-            dedent(
-                """
-        The stars have aligned, Captain.
-        The Universe rolls the dice to decide who takes the first move.
-
-        Let's wait...
-        """
-            )
-        )
+        print(_FIRST_TURN_INTRO)
 
     def _display_initial_positions(self) -> None:
         """Displays the initial board configuration to the player."""
@@ -382,9 +500,10 @@ class CosmicStandoff:
     def display_board(self) -> None:
         """Displays the board coordinates on the screen."""
         print()
-        for character, coordinates in self.board.items():
-            print(f"-- {character} {Coords.X_COORD}: {coordinates[Coords.X_COORD]}")
-            print(f"-- {character} {Coords.Y_COORD}: {coordinates[Coords.Y_COORD]}")
+        for character in Chars.ALL:
+            base = Pos.BASE[character]
+            print(f"-- {character} {Coords.X_COORD}: {self.positions[base + Pos.X_OFFSET]}")
+            print(f"-- {character} {Coords.Y_COORD}: {self.positions[base + Pos.Y_OFFSET]}")
 
     def _start_turns(self) -> bool:
         """Checks if the turns sequence should start.
@@ -399,19 +518,16 @@ class CosmicStandoff:
 
         The order of turns is determined based on who is the starter.
         """
-        match self.turns[Turns.WHO_STARTS]:
-            case Chars.CAP:
-                cast(Captain, self.instances[Chars.CAP]).captain_turn()
-                cast(Alien, self.instances[Chars.ALIEN]).alien_turn()
-            case Chars.ALIEN:
-                cast(Alien, self.instances[Chars.ALIEN]).alien_turn()
-                cast(Captain, self.instances[Chars.CAP]).captain_turn()
-            case _:
-                logging.warning("Unexpected starter: %s.", self.turns[Turns.WHO_STARTS])
-
-    def update_character_board(
-        self, move: Literal[Turns.CAP_MOVE, Turns.ALIEN_MOVE], character: Chars
-    ) -> None:
+        try:
+            first_turn, second_turn = self._turn_order[self.turns[Turns.WHO_STARTS]]
+        except KeyError:
+            logger.warning("Unexpected starter: %s.", self.turns[Turns.WHO_STARTS])
+            return
+
+        first_turn()
+        second_turn()
+
+    def update_character_board(self, move: str, character: str) -> None:
         """Updates the board position of a character based on their move.
 
         Args:
@@ -420,19 +536,15 @@ class CosmicStandoff:
             character: The character whose position is updated
                 ('Chars.CAP' or 'Chars.ALIEN').
         """
-        match self.turns[move]:
-            case Moves.UP:
-                self.board[character][Coords.Y_COORD] += NCons.UNIT_INC
-            case Moves.DOWN:
-                self.board[character][Coords.Y_COORD] -= NCons.UNIT_DEC
-            case Moves.LEFT:
-                self.board[character][Coords.X_COORD] -= NCons.UNIT_DEC
-            case Moves.RIGHT:
-                self.board[character][Coords.X_COORD] += NCons.UNIT_INC
-            case Moves.STILL:
-                pass  # No movement. Intentional no op for clarity.
-            case _:
-                logging.warning("Unexpected move: %s by %s.", self.turns[move], character)
+        try:
+            delta = _MOVE_DELTA[self.turns[move]]
+        except KeyError:
+            logger.warning("Unexpected move: %s by %s.", self.turns[move], character)
+            return
+
+        if delta is not None:
+            offset, step = delta
+            self.positions[Pos.BASE[character] + offset] += step
 
     def is_turn_possible(self) -> bool:
         """Determines if a turn is possible for the Captain or Alien.
@@ -443,8 +555,7 @@ class CosmicStandoff:
         Returns:
             True if both distances are greater than 0, False otherwise.
         """
-        distances = self.retrieve_distances()
-        return all(dist > NCons.ZERO_DIST for dist in distances)
+        return self.x_dist > NCons.ZERO_DIST and self.y_dist > NCons.ZERO_DIST
 
     def _is_game_over(self) -> bool:
         """Checks if the game is over.
@@ -455,8 +566,10 @@ class CosmicStandoff:
         Returns:
             True if either distance is 0, False otherwise.
         """
-        distances = self.retrieve_distances()
-        return NCons.ZERO_DIST in distances
+        # Explicit comparisons, to skip building a tuple for an 'in' check.
+        return (  # pylint: disable=consider-using-in
+            self.x_dist == NCons.ZERO_DIST or self.y_dist == NCons.ZERO_DIST
+        )
 
     def _end_game_sequence(self) -> None:
         """Handles the game's end by determining the winner.
@@ -477,13 +590,11 @@ class CosmicStandoff:
         """
         character = self.turns[Turns.WHO_LAST]
 
-        match character:
-            case Chars.CAP:
-                self._captain_won()
-            case Chars.ALIEN:
-                self._alien_won()
-            case _:
-                logging.warning("Unexpected winner: %s.", character)
+        win_handler = self._win_handler.get(character)
+        if win_handler is not None:
+            win_handler()
+        else:
+            logger.warning("Unexpected winner: %s.", character)
 
         # Updates the score for the winner.
         self.score[character] += NCons.UNIT_INC
@@ -506,6 +617,8 @@ class CosmicStandoff:
 
     def _play_again(self) -> None:
         """Prompts the player to play another game."""
+        import pyinputplus as pyip  # type: ignore  # pylint: disable=import-error,import-outside-toplevel
+
         print("\nDo you want to play again? Type: (yes or no).")
         self.flags[Flags.NEW_GAME] = pyip.inputYesNo() == "yes"
 
@@ -514,25 +627,23 @@ class CosmicStandoff:
         self._write_score()
 
         if self.flags[Flags.NEW_GAME]:
-            logging.debug("Starting a new game.")
+            logger.debug("Starting a new game.")
             self._reset_state()
         else:
             self._exit_game()
 
     def _reset_state(self) -> None:
         """Resets necessary flags and attributes to start a new game."""
-        self.board_config[BConfig.BOARD_SIZE] = NCons.RESET_VAL
-        self.distance[Dist.X_DIST] = NCons.RESET_VAL
-        self.distance[Dist.Y_DIST] = NCons.RESET_VAL
+        self.board_size = NCons.RESET_VAL
+        self.x_dist = NCons.RESET_VAL
+        self.y_dist = NCons.RESET_VAL
         self.flags[Flags.START_TURNS] = False
         self.flags[Flags.NEW_GAME] = False
-        self.score[Chars.CAP] = NCons.RESET_VAL
-        self.score[Chars.ALIEN] = NCons.RESET_VAL
 
     def _exit_game(self) -> None:
         """Exits the game, logging and printing a quit message."""
         exit_message = "Exiting the game..."
-        logging.debug(exit_message)
+        logger.debug(exit_message)
         print(f"\n{exit_message}")
         time.sleep(NCons.SHORT_PAUSE)
         sys.exit(0)
@@ -4,10 +4,16 @@
 # region Module Docstring and Imports.
 """Creates the logging configuration for the Thermo Tracker app."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 
 from constants import Paths
 
+# Set once the logging is configured, so later calls do not add handlers twice.
+_logging_ready = False  # pylint: disable=invalid-name
+
 # endregion.
 
 
@@ -15,17 +21,42 @@ from constants import Paths
 
 
 def logging_configuration() -> None:
-    """Configures the logging settings for the application."""
-    logging.basicConfig(
-        filename=Paths.LOG_PATH,
-        level=logging.DEBUG,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-    )
+    """Configures the logging settings for the application.
+
+    Log records are put on a queue by the calling thread, and a background
+    listener formats them and writes them to the log file, keeping disk I/O
+    out of the game loop. The listener is stopped on exit, so the remaining
+    records are flushed to the file.
+
+    The configuration only runs on the first call, so the log file is not
+    created until the game needs it.
+    """
+    global _logging_ready  # pylint: disable=global-statement
+    if _logging_ready:
+        return
+    _logging_ready = True
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+
+    file_handler = logging.FileHandler(Paths.LOG_PATH, encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.DEBUG)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
 
 def disable_logging() -> None:
-    """Disables logging by setting the level to INFO."""
-    logging.disable(logging.INFO)
+    """Disables INFO and DEBUG logging by raising the root level to WARNING.
+
+    Loggers check the level before creating a record, so the disabled calls
+    return early and 'isEnabledFor()' guards skip building their arguments.
+    """
+    logging.getLogger().setLevel(logging.WARNING)
 
 
 # endregion.